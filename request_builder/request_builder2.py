@@ -16,7 +16,7 @@
 #
 # WISHLIST:
 #  - The Application portion should be an interactive editor to generate the request text.
-#      - Spell checker
+#      - Spell checker (the requests are spell checked before generating, but not in an editor)
 #  - It would be nice to have a each request appear next to the application PDF file for that request.  
 #    Or perhaps a link to the PDF file to be able to open the application.
 #  - restructure as MVC applicaiton with database
@@ -34,6 +34,9 @@
 # * docxtpl
 #    C:\...> pip install docxtpl
 #
+# The spell checker needs a list of words, one per line.  Put it in words.txt
+# in this folder, otherwise /usr/share/dict/words is used when it exists.
+#
 
 ###  UPDATES  ############################################################
 # 
@@ -44,14 +47,30 @@
 # version 0.2.1 - Updated legal paper notice to a version that is no longer for COVID.  
 #               - Added new lines between items for newpaper publication for better results.
 #               - Asks before overwriting PC Notice file
+#
+# 2026-10-19    - ZNGANX generates the Rezoning/Annexation public hearing notice from LEGALDES files.
+#                 Legal descriptions are parsed in parallel and cached between runs.
+#               - Added render_* functions that return the documents as bytes, GenerateTemplates saves them.
+#               - REQUEST.docx and LEGALDES.docx files are streamed with docx_paragraph_texts() instead of python-docx.
+#               - Spell checks the requests before generating the documents.
+#               - Added --preview, which shows DRT, PC, PCNEWS and PCMAIL as text or HTML without the templates.
 
 # internal libraries
+from concurrent.futures import ThreadPoolExecutor
 import datetime as dt
 from enum import Enum
+import hashlib
+import html
+from io import BytesIO
 from itertools import chain
+import json
 import os
 from pathlib import Path
+import re
+import sqlite3
 import sys
+import xml.etree.ElementTree as ET
+import zipfile
 
 if sys.version_info < (3,9):
     from typing import Generator
@@ -60,7 +79,6 @@ else:
     from collections.abc import Generator
 
 # external libaries
-from docx import Document
 from docx.shared import Cm
 from docxtpl import DocxTemplate, RichText
 from loguru import logger
@@ -74,9 +92,11 @@ class UnspecifiedInputError(Exception):
 DEBUG = False
 
 class Request:
-    def __init__(self, text, tags={}):
+    def __init__(self, text, tags={}, filename=None):
         self.text = text
         self.tags = tags
+        # the REQUEST file that the text came from
+        self.filename = filename
 
 class Requests:
     """This class locates requests and stores them in memory."""
@@ -106,22 +126,35 @@ class Requests:
 
         for fn in self._requestfiles:
             req_text, tags = self._get_request_text_with_tags(fn)
-            req_obj = Request(req_text, tags)
+            req_obj = Request(req_text, tags, fn)
             self.requests.append(req_obj)
 
 #        if self.requests == []:
 #            raise ValueError("No requests files found.")
 
-    def _find_request_files(self, folder: Path):
+    @staticmethod
+    def _find_request_files(folder: Path):
         """Finds files .docx Word files and .txt files named 'REQUEST'."""
+        return Requests._find_named_files(folder, 'REQUEST')
+
+    def _find_legal_description_files(self, req: Request):
+        """Finds .docx Word files and .txt files named 'LEGALDES' in the request's folder."""
+        # a Request made in code, not from a REQUEST file, doesn't have a folder
+        if req.filename is None:
+            return []
+        return self._find_named_files(req.filename.parent, 'LEGALDES')
+
+    @staticmethod
+    def _find_named_files(folder: Path, name: str):
+        """Finds .docx Word files and .txt files that have name in their filename."""
         if os.name == 'nt':
            # this worked fine under Windows because file extensions are case insensitive, 
-            docx_files = [fn for fn in folder.rglob('*.docx') if 'REQUEST' in fn.name]
-            txt_files = [fn for fn in folder.rglob('*.txt') if 'REQUEST' in fn.name]
+            docx_files = [fn for fn in folder.rglob('*.docx') if name in fn.name]
+            txt_files = [fn for fn in folder.rglob('*.txt') if name in fn.name]
         else:
             # Fix for Linux case sensitive filenames -- MDC 2023-08-08
-            docx_files = [fn for fn in chain(folder.rglob('*.docx'), folder.rglob('*.DOCX')) if 'REQUEST' in fn.name.upper()]
-            txt_files = [fn for fn in chain(folder.rglob('*.txt'), folder.rglob('*.TXT')) if 'REQUEST' in fn.name.upper()]
+            docx_files = [fn for fn in chain(folder.rglob('*.docx'), folder.rglob('*.DOCX')) if name in fn.name.upper()]
+            txt_files = [fn for fn in chain(folder.rglob('*.txt'), folder.rglob('*.TXT')) if name in fn.name.upper()]
         return docx_files + txt_files
 
     def _find_folders_without_requests(self, folder: Path) -> set:
@@ -139,59 +172,34 @@ class Requests:
     def _get_request_text(self, filename: str) -> str:
         # Note: I think function this might be a little fragile for parsing text.
         # TODO: Could extend development name.
-        doc = Document(filename)
-        return ''.join([p.text for p in doc.paragraphs])
+        return ''.join(docx_paragraph_texts(filename))
             
 
 # TODO: use pathlib not strings, add text file support
-    def _get_request_text_with_tags(self, filename: str):
+    @staticmethod
+    def _get_request_text_with_tags(filename: str):
         # Note: I think function this might be a little fragile for parsing text.
         # TODO: Could extend development name.
         if filename.suffix.lower() == '.docx':
-            doc = Document(filename)
-            return self._parse_request_with_variables(doc.paragraphs)
+            return Requests._parse_request_with_variables(docx_paragraph_texts(filename))
         else:  # assume it is a .txt file
             txtfile = Path(filename)
             with txtfile.open() as fh:
-                return self._parse_request_with_variables_txtfile(fh)
-                
+                return Requests._parse_request_with_variables(fh)
 
-    # NOTE: THIS CODE IS SPECIFIC TO WORD & DOCX, should be made more general to work with TEXT files
-    def _parse_request_with_variables_docxfile(self, paragraphs):
-        variable_mode = False
-        variables = {}
-        request_text = ''
-        
-        for para in paragraphs:
-            if para.text.startswith('---'):
-                # the --- sequence toggles variable_mode on/off
-                if variable_mode:
-                    variable_mode = False
-                else:
-                    variable_mode = True
-                continue
-
-            if variable_mode is True:
-                # variable_text_list.append(para.text)
-                name, value = para.text.split(':')
-                # TODO Could use some robustness for handling empty lines, or throwing out text that doesn't have a variable pair
-                # always lower case the variables name
-                variables[name.strip().lower()] = value.strip()
-            else:
-                request_text += para.text
-        
-        return request_text, variables
+    @staticmethod
+    def _parse_request_with_variables(lines):
+        """
+        Parses the request text and the variables from lines of text.
 
-    # NOTE: THIS WILL BE VERY SIMILAR TO THE DOCX version above
-    # I should probably make a function that I only have to replace the different objects.
-    def _parse_request_with_variables_txtfile(self, fh):
+        lines are the paragraphs of a Word document or the lines of a text file.
+        """
         variable_mode = False
         variables = {}
-        request_text = ''
+        request_text = []
 
-        for line in fh:
+        for line in lines:
             if line.startswith('---'):
-
                 # the --- sequence toggles variable_mode on/off
                 if variable_mode:
                     variable_mode = False
@@ -200,15 +208,14 @@ class Requests:
                 continue
  
             if variable_mode is True:
-                # variable_text_list.append(para.text)
                 name, value = line.split(':')
                 # TODO Could use some robustness for handling empty lines, or throwing out text that doesn't have a variable pair
                 # always lower case the variables name
                 variables[name.strip().lower()] = value.strip()
             else:
-                request_text += line 
+                request_text.append(line)
 
-        return request_text, variables
+        return ''.join(request_text), variables
 
     def item_requires_public_hearing(self, text: str) -> bool:
         # not this was copied from requires_public_hearing.
@@ -267,8 +274,55 @@ class Requests:
 #        for i in range(len(self.requests)):
 #            yield self.requests[i]
 
+    # This is a generator that gives the rezonings and annexations, which need a legal description.
+    def items_requiring_zoning_notice(self) -> Generator:
+        classified = self.classify_requests()
+        yield from chain(classified.get('rezone', []), classified.get('annex', []))
+
+    def legal_descriptions(self, cache=None, max_workers=None) -> list:
+        """
+        Pairs each rezoning and annexation with the text of its LEGALDES file(s).
+
+        The LEGALDES files are parsed in parallel.  Files that are unchanged since
+        the last run are read from the cache (a LegalDescriptionCache) instead.
+
+        returns a list of (Request, legal description) tuples, the legal description
+        is '' when the folder has no LEGALDES file that can be read.
+        """
+        items = list(self.items_requiring_zoning_notice())
+        files_per_item = [self._find_legal_description_files(req) for req in items]
+
+        descriptions = {}
+        to_parse = []
+        for fn in chain.from_iterable(files_per_item):
+            text = cache.get(fn) if cache is not None else None
+            if text is None:
+                to_parse.append(fn)
+            else:
+                descriptions[fn] = text
+
+        if to_parse:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for fn, text in zip(to_parse, pool.map(read_legal_description_or_none, to_parse)):
+                    if text is None:
+                        # unreadable files are not cached, so they are tried again next time
+                        descriptions[fn] = ''
+                        continue
+                    descriptions[fn] = text
+                    if cache is not None:
+                        cache.put(fn, text)
+            if cache is not None:
+                cache.save()
+
+        return [(req, '\n'.join(descriptions[fn] for fn in files if descriptions[fn]))
+                for req, files in zip(items, files_per_item)]
+
     def classify_cases(self) -> dict:
         """This classifies case for the Planning Commission Agenda."""
+        return {key: [req.text for req in reqs] for key, reqs in self.classify_requests().items()}
+
+    def classify_requests(self) -> dict:
+        """Same as classify_cases(), but keeps the Request objects."""
         classified = {}
         classified['unclassified'] = []
 
@@ -294,14 +348,147 @@ class Requests:
                     if kw in req.text:
                         # set up an empty list, if not there
                         classified.setdefault(kw, [])
-                        classified[kw].append(req.text)
+                        classified[kw].append(req)
                         break
             else:
-                classified['unclassified'].append(req.text)
+                classified['unclassified'].append(req)
 
         return classified
 # kw in self.requests[idx].lower() for kw in keywords
 
+
+# WordprocessingML tags used by docx_paragraph_texts()
+W_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+W_BODY = W_NAMESPACE + 'body'
+W_P = W_NAMESPACE + 'p'
+W_R = W_NAMESPACE + 'r'
+W_T = W_NAMESPACE + 't'
+W_TAB = W_NAMESPACE + 'tab'
+W_PTAB = W_NAMESPACE + 'ptab'
+W_NO_BREAK_HYPHEN = W_NAMESPACE + 'noBreakHyphen'
+W_BR = W_NAMESPACE + 'br'
+W_CR = W_NAMESPACE + 'cr'
+W_TYPE = W_NAMESPACE + 'type'
+
+def docx_paragraph_texts(filename: Path) -> Generator:
+    """
+    Generator that gives the text of each paragraph of a Word .docx file.
+
+    This streams word/document.xml out of the .docx zip file instead of loading
+    the document with python-docx, which is much faster and uses constant memory.
+    Like python-docx's Document.paragraphs, only the paragraphs in the body are
+    given, not the ones in tables or text boxes.
+
+    Inside a run, the text is the same as python-docx's: non-breaking hyphens
+    are '-', tabs are '\t', line breaks are '\n', and soft hyphens and symbols
+    (w:softHyphen, w:sym) are left out.
+
+    Unlike python-docx, the runs inside these are included, so the text is what
+    is shown in Word:
+      - tracked insertions (w:ins), as if the changes were accepted.  Tracked
+        deletions are left out.
+      - simple fields (w:fldSimple), their last calculated result
+      - content controls in the paragraph (w:sdt)
+    """
+    with zipfile.ZipFile(filename) as docx_zip, docx_zip.open('word/document.xml') as xml_fh:
+        # tags of the elements that are open, [w:document, w:body, w:p, w:r, ...]
+        path = []
+        body = None
+        text = []
+        for event, elem in ET.iterparse(xml_fh, events=('start', 'end')):
+            if event == 'start':
+                path.append(elem.tag)
+                if elem.tag == W_BODY:
+                    body = elem
+                continue
+
+            path.pop()
+            if len(path) == 2 and path[1] == W_BODY:
+                # finished an element in the body, a paragraph, table, etc.
+                if elem.tag == W_P:
+                    yield ''.join(text)
+                    text.clear()
+                body.clear()
+            elif len(path) > 3 and path[-1] == W_R and path[1:3] == [W_BODY, W_P] and W_P not in path[3:]:
+                # text in a run of a paragraph in the body, but not of a paragraph nested inside it
+                if elem.tag == W_T:
+                    text.append(elem.text or '')
+                elif elem.tag == W_TAB or elem.tag == W_PTAB:
+                    text.append('\t')
+                elif elem.tag == W_NO_BREAK_HYPHEN:
+                    text.append('-')
+                elif elem.tag == W_CR or (elem.tag == W_BR and elem.get(W_TYPE, 'textWrapping') == 'textWrapping'):
+                    text.append('\n')
+
+def read_legal_description(filename: Path) -> str:
+    """Reads the text of a LEGALDES .docx or .txt file, one line per paragraph."""
+    # Legal descriptions are long metes and bounds texts,
+    # so the lines are collected into a list and joined once.
+    if filename.suffix.lower() == '.docx':
+        lines = [text.strip() for text in docx_paragraph_texts(filename)]
+    else:  # assume it is a .txt file
+        with filename.open() as fh:
+            lines = [line.strip() for line in fh]
+    return '\n'.join(line for line in lines if line)
+
+def read_legal_description_or_none(filename: Path):
+    """Same as read_legal_description(), but logs the error and returns None if the file can't be read."""
+    try:
+        return read_legal_description(filename)
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile, ET.ParseError) as err:
+        logger.warning(f'Could not read legal description {filename}: {err}')
+        return None
+
+
+class LegalDescriptionCache:
+    """
+    Stores parsed legal descriptions in a JSON file, so they are not parsed again on the next run.
+
+    An entry is only used when the file's size and modification time have not changed.
+    """
+    FILENAME = '.legaldes_cache.json'
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self._entries = {}
+        self._changed = False
+        if cache_file.exists():
+            try:
+                with cache_file.open(encoding='utf-8') as fh:
+                    self._entries = json.load(fh)
+            except (OSError, ValueError):
+                logger.warning(f'Ignoring unreadable legal description cache: {cache_file}')
+            if not isinstance(self._entries, dict):
+                logger.warning(f'Ignoring unreadable legal description cache: {cache_file}')
+                self._entries = {}
+
+    @staticmethod
+    def _stamp(filename: Path) -> list:
+        stat = filename.stat()
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def get(self, filename: Path):
+        """returns the cached text, or None if the file is not cached or has changed"""
+        entry = self._entries.get(str(filename))
+        if not isinstance(entry, dict) or entry.get('stamp') != self._stamp(filename) \
+                or not isinstance(entry.get('text'), str):
+            return None
+        return entry['text']
+
+    def put(self, filename: Path, text: str):
+        self._entries[str(filename)] = {'stamp': self._stamp(filename), 'text': text}
+        self._changed = True
+
+    def save(self):
+        if self._changed is False:
+            return
+        # write to a temporary file first, so an interrupted run doesn't leave a truncated cache
+        tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        with tmp_file.open('w', encoding='utf-8') as fh:
+            json.dump(self._entries, fh)
+        os.replace(tmp_file, self.cache_file)
+        self._changed = False
+
 # Does this item need a public hearing?
 # Searches if certain key phrases are in that require a public hearing.
 # This will occationally get tripped up.
@@ -314,125 +501,317 @@ class Requests:
 #    return requires_pub_hearing_keywords in lower(text) 
 
 
+###  SPELL CHECKER  ######################################################
+#
+# Spell checks the request text before the documents are generated, so typos
+# don't go into the newspaper legal notice and mailed notices.
+#
+# The dictionary is a symmetric delete index (the SymSpell algorithm).  Every word
+# is indexed under the strings made by deleting up to max_edit_distance letters
+# from it.  A misspelled word finds its suggestions by looking up its own deletes,
+# instead of computing the edit distance to every word in the dictionary.
+
+# words list for the dictionary, the first one that exists is used
+WORD_LISTS = (Path(__file__).parent / 'words.txt', Path('/usr/share/dict/words'))
+
+# These words are added to the dictionary
+PLANNING_VOCABULARY = ['R-1-1', 'R-1-3', 'B-2', 'TN-2', 'HN', 'EST',
+                       'annex', 'annexation', 'rezone', 'rezoning', 'replat', 're-plat',
+                       'subdivide', 'subdivision', 'resubdivision', 'resub', 'preliminary', 'plat',
+                       'tract', 'tracts', 'acres', 'metes', 'LLC', 'Inc']
+
+# words, zoning codes like R-1-3, and possessives like Applicant's
+WORD_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9]*(?:[-'][A-Za-z0-9]+)*")
+ZONING_CODE_PATTERN = re.compile(r"[A-Z]+-\d")
+
+class SpellChecker:
+    """
+    Symmetric delete spell checker, words are indexed by their deletes.
+
+    The dictionary is a SQLite file with a table of the words and their counts,
+    and a table of the deletes.  A lookup only reads the rows it needs, about 30
+    deletes for a misspelled word, so nothing has to be loaded before checking.
+    """
+    FILENAME = '.spelling_index.sqlite'
+    # change this when the way the dictionary is built changes, so it is rebuilt
+    VERSION = 3
+
+    def __init__(self, filename: Path, max_edit_distance=2, prefix_length=7):
+        """raises sqlite3.DatabaseError if the file is not a SQLite database"""
+        self.filename = filename
+        self.max_edit_distance = max_edit_distance
+        # only the beginning of the word is indexed, which keeps the index small
+        self.prefix_length = prefix_length
+        self.connection = sqlite3.connect(str(filename))
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS words (word TEXT PRIMARY KEY, count INTEGER) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS deletes (deleted TEXT PRIMARY KEY, words TEXT) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS sources (name TEXT PRIMARY KEY);
+        ''')
+
+    def make_fingerprint(self, word_list: Path) -> str:
+        """A hash of the word list, the planning vocabulary and the settings the dictionary is built from."""
+        sha = hashlib.sha256(word_list.read_bytes())
+        settings = [self.VERSION, self.max_edit_distance, self.prefix_length, PLANNING_VOCABULARY]
+        sha.update(json.dumps(settings).encode('utf-8'))
+        return sha.hexdigest()
+
+    @property
+    def fingerprint(self):
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        return row[0] if row else None
+
+    @fingerprint.setter
+    def fingerprint(self, value: str):
+        self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)", (value,))
+
+    def has_source(self, name: str) -> bool:
+        """Is the past DRT folder already in the dictionary?"""
+        return self.connection.execute('SELECT 1 FROM sources WHERE name = ?', (name,)).fetchone() is not None
+
+    def add_source(self, name: str):
+        self.connection.execute('INSERT OR IGNORE INTO sources VALUES (?)', (name,))
+
+    def commit(self):
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+    def _count(self, word: str):
+        """the word's count, None if the word is not in the dictionary"""
+        row = self.connection.execute('SELECT count FROM words WHERE word = ?', (word,)).fetchone()
+        return row[0] if row else None
+
+    def add_word(self, word: str, count=1):
+        self.add_words([word], count)
+
+    def add_words(self, words, count=1):
+        counts = {}
+        for word in words:
+            word = word.lower()
+            counts[word] = counts.get(word, 0) + count
+
+        new_words = []
+        rows = []
+        for word, word_count in counts.items():
+            old_count = self._count(word)
+            if old_count is None:
+                new_words.append(word)
+                rows.append((word, word_count))
+            else:
+                rows.append((word, old_count + word_count))
+        self.connection.executemany('INSERT OR REPLACE INTO words VALUES (?, ?)', rows)
+
+        deletes = {}
+        for word in new_words:
+            for delete in self._deletes(word[:self.prefix_length]):
+                deletes.setdefault(delete, []).append(word)
+        # when the dictionary is first built there is nothing to add onto
+        is_empty = self.connection.execute('SELECT 1 FROM deletes LIMIT 1').fetchone() is None
+        rows = []
+        for delete, delete_words in deletes.items():
+            if not is_empty:
+                row = self.connection.execute('SELECT words FROM deletes WHERE deleted = ?', (delete,)).fetchone()
+                if row:
+                    delete_words = row[0].split('\n') + delete_words
+            rows.append((delete, '\n'.join(delete_words)))
+        self.connection.executemany('INSERT OR REPLACE INTO deletes VALUES (?, ?)', rows)
+
+    def _deletes(self, word: str) -> set:
+        """the word and all the strings with up to max_edit_distance letters deleted"""
+        deletes = {word}
+        edits = {word}
+        for _ in range(self.max_edit_distance):
+            edits = {e[:i] + e[i+1:] for e in edits for i in range(len(e))}
+            deletes |= edits
+        return deletes
+
+    def lookup(self, word: str, max_suggestions=3, max_edit_distance=None) -> list:
+        """
+        Suggestions for a word, closest and most common first.
+
+        returns [] when the word is in the dictionary
+        """
+        if max_edit_distance is None:
+            max_edit_distance = self.max_edit_distance
+        word = word.lower()
+        if self._count(word) is not None:
+            return []
+
+        candidates = set()
+        for delete in self._deletes(word[:self.prefix_length]):
+            row = self.connection.execute('SELECT words FROM deletes WHERE deleted = ?', (delete,)).fetchone()
+            if row:
+                candidates.update(row[0].split('\n'))
+
+        suggestions = []
+        for candidate in candidates:
+            if abs(len(candidate) - len(word)) > max_edit_distance:
+                continue
+            distance = edit_distance(word, candidate, max_edit_distance)
+            if distance <= max_edit_distance:
+                suggestions.append((distance, -self._count(candidate), candidate))
+        suggestions.sort()
+        return [candidate for _, _, candidate in suggestions[:max_suggestions]]
+
+    def check(self, text: str) -> list:
+        """
+        Finds the misspelled words in the text, each word is only reported once.
+
+        Capitalized words that are not in the dictionary are usually names, so those
+        are only reported when there is a suggestion that is one edit away.
+
+        returns a list of (word, suggestions)
+        """
+        misspelled = []
+        checked = set()
+        for word in WORD_PATTERN.findall(text):
+            if word.lower().endswith("'s"):
+                word = word[:-2]
+            if len(word) < 2 or word.lower() in checked:
+                continue
+            checked.add(word.lower())
+            if self._count(word.lower()) is not None:
+                continue
+            if word[0].islower():
+                misspelled.append((word, self.lookup(word)))
+            else:
+                suggestions = self.lookup(word, max_edit_distance=1)
+                if suggestions:
+                    misspelled.append((word, suggestions))
+        return misspelled
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Damerau-Levenshtein distance (optimal string alignment) between a and b.
+
+    returns max_distance + 1 as soon as the distance is known to be larger than max_distance
+    """
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i-1] == b[j-1] else 1
+            current[j] = min(previous[j] + 1,         # deletion
+                             current[j-1] + 1,        # insertion
+                             previous[j-1] + cost)    # substitution
+            if i > 1 and j > 1 and a[i-1] == b[j-2] and a[i-2] == b[j-1]:
+                current[j] = min(current[j], previous2[j-2] + 1)  # transposition
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+def vocabulary_words(text: str) -> list:
+    """
+    The words of a past request that are added to the dictionary.
+
+    Only capitalized words (street names, development names) and zoning codes are
+    added, so a typo in a past request's text isn't accepted from then on.
+    """
+    words = []
+    for word in WORD_PATTERN.findall(text):
+        if word.lower().endswith("'s"):
+            word = word[:-2]
+        if ZONING_CODE_PATTERN.match(word) or word[0].isupper():
+            words.append(word)
+    return words
+
+def add_past_requests(spell_checker: SpellChecker, folder: Path):
+    """Adds the vocabulary of the requests in a past DRT folder, skipping files that can't be read."""
+    try:
+        request_files = Requests._find_request_files(folder)
+    except OSError as err:
+        logger.warning(f'Spell checker skipped folder {folder}: {err}')
+        return
+    for fn in request_files:
+        try:
+            text, _ = Requests._get_request_text_with_tags(fn)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile, ET.ParseError) as err:
+            logger.warning(f'Spell checker skipped {fn}: {err}')
+            continue
+        spell_checker.add_words(vocabulary_words(text))
+
+def load_spell_checker(drt_main_folder: Path, drt_folder: Path):
+    """
+    Opens the spell checker's dictionary in the DRT main folder, or builds it the first time.
+
+    The names and zoning codes from the requests in the past DRT folders are added
+    to the dictionary, so the street names and development names from those
+    requests are known.  Past folders that are new since the last run are added.
+
+    The dictionary is built again when the word list, the planning vocabulary
+    or the spell checker's settings have changed.
+
+    returns None if there is no word list
+    """
+    word_list = next((fn for fn in WORD_LISTS if fn.exists()), None)
+    if word_list is None:
+        return None
+
+    index_file = drt_main_folder / SpellChecker.FILENAME
+    spell_checker = None
+    try:
+        spell_checker = SpellChecker(index_file)
+        fingerprint = spell_checker.make_fingerprint(word_list)
+        up_to_date = spell_checker.fingerprint == fingerprint
+    except sqlite3.DatabaseError as err:
+        logger.warning(f'Rebuilding unreadable spell checker dictionary {index_file}: {err}')
+        up_to_date = False
+
+    if up_to_date is False:
+        # start over with a new file
+        if spell_checker is not None:
+            spell_checker.close()
+        if index_file.exists():
+            index_file.unlink()
+        spell_checker = SpellChecker(index_file)
+        fingerprint = spell_checker.make_fingerprint(word_list)
+        with word_list.open(encoding='utf-8', errors='ignore') as fh:
+            spell_checker.add_words(line.strip() for line in fh if line.strip())
+        spell_checker.add_words(PLANNING_VOCABULARY)
+        # the fingerprint is saved with the words, so an interrupted build is started over
+        spell_checker.fingerprint = fingerprint
+        spell_checker.commit()
+
+    past_folders = [fo for fo in drt_main_folder.iterdir()
+                    if fo.is_dir() and fo != drt_folder and not spell_checker.has_source(fo.name)]
+    for folder in past_folders:
+        add_past_requests(spell_checker, folder)
+        # the folder is done even if some of its files could not be read,
+        # otherwise the same files would be tried again on every run
+        spell_checker.add_source(folder.name)
+        spell_checker.commit()
+
+    return spell_checker
+
+
 # This class generates using the docx templates.
+# The documents are rendered by the render_* functions below, this class
+# handles the folders, asking before overwriting and printing to the screen.
 class GenerateTemplates:
     """Generates agendas, letters, and notices based on docx templates."""
 # requests is of type list[str]
     def __init__(self, meeting_dates, drt_folder, pc_folder):
-        self.templates = 'templates'
+        self.templates = TEMPLATES_FOLDER
         self.meeting_dates = meeting_dates
         self.drt_folder = drt_folder
         self.pc_folder = pc_folder
 
     def generate_public_hear_form_for_newspaper_legal(self, requests: Requests):
-        pub_hearing_requests = []
-        # if this becomes more compliated it should be done by a Requests class
-        # for req in requests:
-        #    if item_requires_public_hearing(req):
-        #        pub_hearing_requests.append(req)
-        
-        # These are Request objects
-        ph_list = list(requests.items_requiring_public_hearing())
-        # convert Request objects to a list of strings with newlines
-        ph_list = [req_obj.text + '\n' for req_obj in ph_list]
-        
-        context = {
-            'pc_meeting_date_str': spelled_out_date(self.meeting_dates.pc),
-            'paper_notice_date': self.meeting_dates.paper_notice.isoformat(),
-         #   'public_hearing_list': "  This is just for a test " 
-#            'public_hearing_list' : RichText('\a'.join(ph_list))
-            'public_hearing_list': RichText(self.numbered_list(ph_list))
-        }
-        doc = DocxTemplate(self.templates + "/PC Notice Template.docx")
-        doc.render(context)
+        document = render_pc_notice(requests, self.meeting_dates, self.templates)
         publish_date_str = self.meeting_dates.paper_notice.isoformat() 
-        # doc.save(drt_folder + f"\public notice\PC Notice {publish_date_str}.docx")
-#        print(f'Public Notice Folder "{pn_folder}" exists: {pn_folder.exists()}')
-
-        pn_folder = self.drt_folder / 'public notice'
-        # if the 'public notice' folder doesn't exist, create it
-        if pn_folder.is_dir() is False:
-            pn_folder.mkdir()
-            print(f"Created folder: {pn_folder}")
-
-        notice_file = self.drt_folder / 'public notice' / f'PC Notice {publish_date_str}.docx'
-
-        if file_does_not_exist_or_user_allows_overwriting(notice_file) is True:
-            doc.save(notice_file)
-            print(f"Wrote file: {notice_file}")
 
+        pn_folder = self._sub_folder('public notice')
+        self._save(document, pn_folder / f'PC Notice {publish_date_str}.docx')
 
-    # Pseudocode
-    # 1. classify the items  (NOTE: this level might be overkill.)
-    # 2. arrange the agenda using the clasifications
-    #     One appraoch would be to have a section for the items
-
-    # TODO THIS DOESN'T WORK.  I RAN OUT OF TIME FOR THIS in November.
     def generate_agenda(self, requests):
-        # lighter elements should go first
-        weight = {  "old_business": 0,
-                    "certificates": 10,
-                    "minor subdivision": 20,
-                    "subdivsion":30,
-                    "rezoning":40,
-                    "annexation":45,
-                    "location/character/extent":70,
-                    "ord/reg amendment":100
-        }
-
-        context = {
-            'pc_meeting_date_str': spelled_out_date(self.meeting_dates.pc),
-            'return_revised_plans_date_str': None # TODO
-        }
-        doc = DocxTemplate(self.templates + "/PC Agenda Template.docx")
-        doc.render(context)
-
-
-        classified = requests.classify_cases()
-        i = 2
-
-        # write the items 
-        for key, cases in classified.items():
-            # add headings like "REZONING"
-            p = doc.add_paragraph('')
-            run = p.add_run("\n" + key.upper())
-            run.bold = True
-            run.underline = True
-            for case in cases:
-                p = doc.add_paragraph('\n')
-                need_ph = requests.item_requires_public_hearing(case)
-                if need_ph is True:
-                    # Request needs a Public Hearing
-                    p.add_run(f'{i}) ')
-                    p.paragraph_format.left_indent = Cm(0.5)
-                    p = doc.add_paragraph('a) ')
-                    run = p.add_run('Public Hearing')
-                    run.underline = True
-                    run.bold = True
-                    p.add_run('. ')
-                    p.add_run(case)
-                    p.paragraph_format.left_indent = Cm(1)
-                    p = doc.add_paragraph('\nb) ')
-                    run = p.add_run('Resolution')
-                    run.underline = True
-                    run.bold = True
-                    p.add_run('. ')
-                    p.paragraph_format.left_indent = Cm(1)
-                else:
-                    # Request doe NOT need a Public Hearing
-                    p.add_run(f'{i}) ')
-                    run = p.add_run('Resolution')
-                    run.underline = True
-                    run.bold = True
-                    p.add_run('. ')
-                    p.add_run(case)
-                    p.paragraph_format.left_indent = Cm(0.5)
-                i += 1
+        document = render_pc_agenda(requests, self.meeting_dates, self.templates)
         filename = self.pc_folder / f'GENERATED - PC Agenda - {self.meeting_dates.pc.isoformat()}.docx'
-        
-        if file_does_not_exist_or_user_allows_overwriting(filename) is True:
-            doc.save(filename)
-            print(f"Wrote file: {filename}")
+        self._save(document, filename)
 
     def generate_drt_agenda (self, requests: Requests):
         """Generate Departmental Review Team (DRT) Agenda
@@ -440,36 +819,12 @@ class GenerateTemplates:
         outputs file named:  GENERATED  MONTH YYYY DRT Agenda YYYY-MM-DD.docx"""
         logger.debug(requests.requests)
 
-        # this adds the dates onto the agenda
-        context = {
-            'drt_date': spelled_out_date_w_weekday(self.meeting_dates.drt),
-            'return_revised_plans_date': spelled_out_date_w_weekday(self.meeting_dates.friday_resubmittal)
-        }
-        doc = DocxTemplate(self.templates + "/DRT Agenda Template.docx")
-        doc.render(context)
-
-        # add agemda items 
-        # This is a tuple representing the departments which comment in the Departmental Review Team (DRT)
-        departments_tuple = ('FIRE', 'WATER', 'ES&CD', 'ELECTRIC', 'GAS', 'CITY ENGINEER', 'MISC', '')
-        departments_comment_text = ':\n\n'.join(departments_tuple)
-        for n, req in enumerate(requests.requests, start=1):
-            p = doc.add_paragraph('')
-            p.add_run(f'{n}. {req.text}').bold = True
-            doc.add_paragraph(departments_comment_text)
-        agenda_fn = drt_folder / f"GENERATED - {self.meeting_dates.drt.strftime('%B %Y')} DRT Agenda - {self.meeting_dates.drt.isoformat()}.docx"
-        if file_does_not_exist_or_user_allows_overwriting(agenda_fn) is True:
-            # try:
-                doc.save(agenda_fn)
-            # except PermissionError:
-            #    print("PermissionError: Access")
-            # TODO needs to catch PermissionError, this happens when you can't open the file.  In case whne you have the other file open in Word or another program.
+        document = render_drt_agenda(requests, self.meeting_dates, self.templates)
+        agenda_fn = self.drt_folder / f"GENERATED - {self.meeting_dates.drt.strftime('%B %Y')} DRT Agenda - {self.meeting_dates.drt.isoformat()}.docx"
+        self._save(document, agenda_fn)
 
     def generate_city_mailed_notice(self, requests:Requests):
-        mailed_notice_folder = self.drt_folder / 'mailed notice'
-        # if the 'mailed notice' folder doesn't exist, create it
-        if mailed_notice_folder.is_dir() is False:
-            mailed_notice_folder.mkdir()
-            print(f"Created folder: {mailed_notice_folder}")
+        mailed_notice_folder = self._sub_folder('mailed notice')
 
         # commented out COVID related meeting procedures
         # Ask about which template to use for the mailed notice
@@ -483,51 +838,54 @@ class GenerateTemplates:
 #        while meeting_selection not in ['r', 'i', 'v']:
 #            meeting_selection = input("?").lower()
 
+        mailing_date = self.meeting_dates.mailed_notice.isoformat()
         i = 0
         for request_obj in requests.items_requiring_city_mailed_notice():
-            # Note: Might be easier to use a json dump from the application PDF files
-            
-            dev_name = 'Untitled Development'
-            # get development name from tags
-            if 'short_title' in request_obj.tags: 
-                dev_name = request_obj.tags['short_title']
-
-            mailing_date = self.meeting_dates.mailed_notice.isoformat()
-
-            context = {
-                'mailing_date': mailing_date,
-                'development_name': dev_name,
-                'pc_meeting_date': spelled_out_date_w_weekday(self.meeting_dates.pc),  # REDO: Failed in November, fixed in December
-                'request_text': request_obj.text 
-            }
-            if DEBUG is True:
-                print(f"DEBUG: context={context}")
-
-            doc = DocxTemplate(self.templates + "/PC mailed notice Template.docx")
-            # commented out COVID related meeting proceedures
-#            if meeting_selection == 'r':  # Regular Meeting
-#                doc = DocxTemplate(self.templates + "\PC mailed notice Template.docx")
-#            elif meeting_selection == 'i':  # COVID in person meeting
-#                doc = DocxTemplate(self.templates + "\PC mailed notice Template - COVID Inperson.docx")
-#            elif meeting_selection == 'v':  # COVID virtual meeting 
-#                doc = DocxTemplate(self.templates + "\PC mailed notice Template - COVID virtual.docx")
-#            else:
-#                raise UnspecifiedInputError("The input function is giving results that it shouldn't be, namely '{meeting_selection}'.  You shouldn't be seeing this.")
-            doc.render(context)
-            
+            document = render_city_mailed_notice(request_obj, self.meeting_dates, self.templates)
+
             # Saves the notice as an number and a development name,
             # in case there is more than one of the same name.
-            filename = mailed_notice_folder / f'PC mailed notice {i} - {dev_name} - mail {mailing_date}.docx'
-            if file_does_not_exist_or_user_allows_overwriting(filename):
-                doc.save(filename)
+            filename = mailed_notice_folder / f'PC mailed notice {i} - {development_name(request_obj)} - mail {mailing_date}.docx'
+            self._save(document, filename, quiet=True)
             i += 1
         print(f'Wrote {i} files to folder: {mailed_notice_folder}')
 
-    def numbered_list(self, req_list):
-        s = ''
-        for num, item in enumerate(req_list, start=1):
-            s += f'{num}. {item}\n'
-        return s
+    def generate_zoning_annexation_notice(self, requests: Requests):
+        """Public Hearing notice for the Rezonings and Annexations, including their legal descriptions."""
+        cache = LegalDescriptionCache(self.drt_folder / LegalDescriptionCache.FILENAME)
+        legal_descriptions = requests.legal_descriptions(cache)
+        if legal_descriptions == []:
+            print("There are no rezonings or annexations.")
+            return
+
+        for req_obj, legal_desc in legal_descriptions:
+            if legal_desc == '':
+                if req_obj.filename is None:
+                    print(f'No LEGALDES file for the request: {req_obj.text[:60]}...')
+                else:
+                    print(f'No LEGALDES file found in folder: {req_obj.filename.parent}')
+
+        document = render_zoning_annexation_notice(legal_descriptions, self.meeting_dates, self.templates)
+        publish_date_str = self.meeting_dates.paper_notice.isoformat()
+
+        pn_folder = self._sub_folder('public notice')
+        self._save(document, pn_folder / f'Rezoning Annexation Notice {publish_date_str}.docx')
+
+    def _sub_folder(self, name: str) -> Path:
+        """returns the named folder in the DRT folder, creating it if it doesn't exist"""
+        folder = self.drt_folder / name
+        if folder.is_dir() is False:
+            folder.mkdir()
+            print(f"Created folder: {folder}")
+        return folder
+
+    def _save(self, document: bytes, filename: Path, quiet=False):
+        """Writes a rendered document, asking first if the file already exists."""
+        if file_does_not_exist_or_user_allows_overwriting(filename) is True:
+            # TODO needs to catch PermissionError, this happens when you can't open the file.  In case whne you have the other file open in Word or another program.
+            filename.write_bytes(document)
+            if quiet is False:
+                print(f"Wrote file: {filename}")
         
 #    def generate_subdivision_letters(meeting_dates, requests):
 #        for req in requests:
@@ -600,6 +958,295 @@ def spelled_out_date(dateobj: dt.date) -> str:
     """
     return dateobj.strftime('%B %d, %Y')
 
+
+###  RENDERING  ##########################################################
+#
+# These functions render the documents in memory and return the .docx file as bytes,
+# so the documents can be used without writing them to a folder first.
+# GenerateTemplates writes them to the DRT and PC folders.
+
+# the templates are next to this file, so the render_* functions work from any working directory
+TEMPLATES_FOLDER = Path(__file__).parent / 'templates'
+
+# This is a tuple representing the departments which comment in the Departmental Review Team (DRT)
+DRT_DEPARTMENTS = ('FIRE', 'WATER', 'ES&CD', 'ELECTRIC', 'GAS', 'CITY ENGINEER', 'MISC', '')
+DRT_DEPARTMENTS_COMMENT_TEXT = ':\n\n'.join(DRT_DEPARTMENTS)
+
+# The *_context() and *_items() functions are the content of the documents.
+# They are used by both the render_* functions and the preview_* functions,
+# so a preview has the same numbering, headings and dates as the document.
+
+def drt_agenda_context(dates: MeetingDates) -> dict:
+    # this adds the dates onto the agenda
+    return {
+        'drt_date': spelled_out_date_w_weekday(dates.drt),
+        'return_revised_plans_date': spelled_out_date_w_weekday(dates.friday_resubmittal)
+    }
+
+def drt_agenda_items(requests: Requests) -> list:
+    """returns a list of the agenda items' text, like '1. Request of ...'"""
+    return [f'{n}. {req.text}' for n, req in enumerate(requests.requests, start=1)]
+
+def render_drt_agenda(requests: Requests, dates: MeetingDates, templates=TEMPLATES_FOLDER) -> bytes:
+    """Departmental Review Team (DRT) Agenda"""
+    doc = DocxTemplate(Path(templates) / "DRT Agenda Template.docx")
+    doc.render(drt_agenda_context(dates))
+
+    # add agemda items 
+    for item in drt_agenda_items(requests):
+        p = doc.add_paragraph('')
+        p.add_run(item).bold = True
+        doc.add_paragraph(DRT_DEPARTMENTS_COMMENT_TEXT)
+    return _document_bytes(doc)
+
+# Pseudocode
+# 1. classify the items  (NOTE: this level might be overkill.)
+# 2. arrange the agenda using the clasifications
+#     One appraoch would be to have a section for the items
+
+# TODO THIS DOESN'T WORK.  I RAN OUT OF TIME FOR THIS in November.
+def pc_agenda_context(dates: MeetingDates) -> dict:
+    return {
+        'pc_meeting_date_str': spelled_out_date(dates.pc),
+        'return_revised_plans_date_str': None # TODO
+    }
+
+def pc_agenda_sections(requests: Requests) -> list:
+    """
+    The items of the Planning Commission agenda, grouped by classification
+
+    returns a list of (heading, items), the items are a list of (number, case text, needs public hearing)
+    """
+    # lighter elements should go first
+    weight = {  "old_business": 0,
+                "certificates": 10,
+                "minor subdivision": 20,
+                "subdivsion":30,
+                "rezoning":40,
+                "annexation":45,
+                "location/character/extent":70,
+                "ord/reg amendment":100
+    }
+
+    classified = requests.classify_cases()
+    i = 2
+
+    sections = []
+    for key, cases in classified.items():
+        items = []
+        for case in cases:
+            items.append((i, case, requests.item_requires_public_hearing(case)))
+            i += 1
+        # headings like "REZONING"
+        sections.append((key.upper(), items))
+    return sections
+
+def render_pc_agenda(requests: Requests, dates: MeetingDates, templates=TEMPLATES_FOLDER) -> bytes:
+    """Planning Commission (PC) Agenda"""
+    doc = DocxTemplate(Path(templates) / "PC Agenda Template.docx")
+    doc.render(pc_agenda_context(dates))
+
+    # write the items 
+    for heading, items in pc_agenda_sections(requests):
+        # add headings like "REZONING"
+        p = doc.add_paragraph('')
+        run = p.add_run("\n" + heading)
+        run.bold = True
+        run.underline = True
+        for i, case, need_ph in items:
+            p = doc.add_paragraph('\n')
+            if need_ph is True:
+                # Request needs a Public Hearing
+                p.add_run(f'{i}) ')
+                p.paragraph_format.left_indent = Cm(0.5)
+                p = doc.add_paragraph('a) ')
+                run = p.add_run('Public Hearing')
+                run.underline = True
+                run.bold = True
+                p.add_run('. ')
+                p.add_run(case)
+                p.paragraph_format.left_indent = Cm(1)
+                p = doc.add_paragraph('\nb) ')
+                run = p.add_run('Resolution')
+                run.underline = True
+                run.bold = True
+                p.add_run('. ')
+                p.paragraph_format.left_indent = Cm(1)
+            else:
+                # Request doe NOT need a Public Hearing
+                p.add_run(f'{i}) ')
+                run = p.add_run('Resolution')
+                run.underline = True
+                run.bold = True
+                p.add_run('. ')
+                p.add_run(case)
+                p.paragraph_format.left_indent = Cm(0.5)
+    return _document_bytes(doc)
+
+def pc_notice_context(requests: Requests, dates: MeetingDates) -> dict:
+    """public_hearing_list is plain text, render_pc_notice() makes it RichText"""
+    # These are Request objects
+    ph_list = list(requests.items_requiring_public_hearing())
+    # convert Request objects to a list of strings with newlines
+    ph_list = [req_obj.text + '\n' for req_obj in ph_list]
+    
+    return {
+        'pc_meeting_date_str': spelled_out_date(dates.pc),
+        'paper_notice_date': dates.paper_notice.isoformat(),
+     #   'public_hearing_list': "  This is just for a test " 
+#            'public_hearing_list' : RichText('\a'.join(ph_list))
+        'public_hearing_list': numbered_list(ph_list)
+    }
+
+def render_pc_notice(requests: Requests, dates: MeetingDates, templates=TEMPLATES_FOLDER) -> bytes:
+    """Planning Commission Public Hearings newspaper publication"""
+    context = pc_notice_context(requests, dates)
+    context['public_hearing_list'] = RichText(context['public_hearing_list'])
+    doc = DocxTemplate(Path(templates) / "PC Notice Template.docx")
+    doc.render(context)
+    return _document_bytes(doc)
+
+def city_mailed_notice_context(request_obj: Request, dates: MeetingDates) -> dict:
+    # Note: Might be easier to use a json dump from the application PDF files
+    return {
+        'mailing_date': dates.mailed_notice.isoformat(),
+        'development_name': development_name(request_obj),
+        'pc_meeting_date': spelled_out_date_w_weekday(dates.pc),  # REDO: Failed in November, fixed in December
+        'request_text': request_obj.text 
+    }
+
+def render_city_mailed_notice(request_obj: Request, dates: MeetingDates, templates=TEMPLATES_FOLDER) -> bytes:
+    """City mailed notice of a Public Hearing for one request"""
+    context = city_mailed_notice_context(request_obj, dates)
+    if DEBUG is True:
+        print(f"DEBUG: context={context}")
+
+    doc = DocxTemplate(Path(templates) / "PC mailed notice Template.docx")
+    # commented out COVID related meeting proceedures
+#    if meeting_selection == 'r':  # Regular Meeting
+#        doc = DocxTemplate(self.templates + "\PC mailed notice Template.docx")
+#    elif meeting_selection == 'i':  # COVID in person meeting
+#        doc = DocxTemplate(self.templates + "\PC mailed notice Template - COVID Inperson.docx")
+#    elif meeting_selection == 'v':  # COVID virtual meeting 
+#        doc = DocxTemplate(self.templates + "\PC mailed notice Template - COVID virtual.docx")
+#    else:
+#        raise UnspecifiedInputError("The input function is giving results that it shouldn't be, namely '{meeting_selection}'.  You shouldn't be seeing this.")
+    doc.render(context)
+    return _document_bytes(doc)
+
+def render_zoning_annexation_notice(legal_descriptions: list, dates: MeetingDates, templates=TEMPLATES_FOLDER) -> bytes:
+    """
+    Public Hearing notice for the Rezonings and Annexations
+
+    legal_descriptions is the list of (Request, legal description) from Requests.legal_descriptions()
+    """
+    ph_list = [req_obj.text + '\n' + legal_desc + '\n' for req_obj, legal_desc in legal_descriptions]
+
+    context = {
+        'pc_meeting_date_str': spelled_out_date(dates.pc),
+        'paper_notice_date': dates.paper_notice.isoformat(),
+        'public_hearing_list': RichText(numbered_list(ph_list))
+    }
+    doc = DocxTemplate(Path(templates) / "PC Notice Template.docx")
+    doc.render(context)
+    return _document_bytes(doc)
+
+def _document_bytes(doc) -> bytes:
+    """Saves the document to a BytesIO buffer and returns the bytes."""
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+def development_name(request_obj: Request) -> str:
+    """the development name from the 'short_title' tag"""
+    return request_obj.tags.get('short_title', 'Untitled Development')
+
+def numbered_list(req_list):
+    # join once, legal descriptions can make these items very long
+    return ''.join(f'{num}. {item}\n' for num, item in enumerate(req_list, start=1))
+
+
+###  PREVIEW  ############################################################
+#
+# Previews show the content of a document as text or HTML, without loading the
+# templates or writing a .docx file, so the agenda can be proofread quickly.
+#
+# A preview is a list of (style, text) blocks.  The styles are:
+#   'title', 'heading', 'paragraph', 'indent' (indented one level), 'indent2' (two levels)
+
+def preview_drt_agenda(requests: Requests, dates: MeetingDates) -> list:
+    context = drt_agenda_context(dates)
+    blocks = [('title', 'Departmental Review Team - DRT Agenda'),
+              ('paragraph', context['drt_date']),
+              ('paragraph', f"Return revised plans by {context['return_revised_plans_date']}.")]
+    for item in drt_agenda_items(requests):
+        blocks.append(('paragraph', item))
+        blocks.append(('indent', DRT_DEPARTMENTS_COMMENT_TEXT))
+    return blocks
+
+def preview_pc_agenda(requests: Requests, dates: MeetingDates) -> list:
+    context = pc_agenda_context(dates)
+    blocks = [('title', 'Planning Commission - Regular Meeting Agenda'),
+              ('paragraph', context['pc_meeting_date_str'])]
+    for heading, items in pc_agenda_sections(requests):
+        blocks.append(('heading', heading))
+        for i, case, need_ph in items:
+            if need_ph is True:
+                blocks.append(('indent', f'{i}) '))
+                blocks.append(('indent2', f'a) Public Hearing. {case}'))
+                blocks.append(('indent2', 'b) Resolution. '))
+            else:
+                blocks.append(('indent', f'{i}) Resolution. {case}'))
+    return blocks
+
+def preview_pc_notice(requests: Requests, dates: MeetingDates) -> list:
+    context = pc_notice_context(requests, dates)
+    return [('title', 'Planning Commission - Public Hearings'),
+            ('paragraph', context['pc_meeting_date_str']),
+            ('paragraph', context['public_hearing_list']),
+            ('paragraph', f"Published in the newspaper on {context['paper_notice_date']}.")]
+
+def preview_city_mailed_notices(requests: Requests, dates: MeetingDates) -> list:
+    blocks = []
+    for i, request_obj in enumerate(requests.items_requiring_city_mailed_notice()):
+        context = city_mailed_notice_context(request_obj, dates)
+        blocks.append(('title', f"PC mailed notice {i} - {context['development_name']}"))
+        blocks.append(('paragraph', f"Date: {context['mailing_date']}"))
+        blocks.append(('paragraph', f"Re: Public Hearing for {context['development_name']}"))
+        blocks.append(('paragraph', f"Public Hearing on {context['pc_meeting_date']}"))
+        blocks.append(('indent', context['request_text']))
+    return blocks
+
+PREVIEW_INDENT = {'indent': 1, 'indent2': 2}
+
+def preview_as_text(blocks: list) -> str:
+    lines = []
+    for style, text in blocks:
+        if style == 'title':
+            lines += ['', text, '=' * len(text)]
+        elif style == 'heading':
+            lines += ['', text, '-' * len(text)]
+        else:
+            indent = '    ' * PREVIEW_INDENT.get(style, 0)
+            lines += [indent + line for line in text.split('\n')]
+            lines.append('')
+    return '\n'.join(lines)
+
+def preview_as_html(blocks: list, title: str) -> str:
+    parts = ['<!DOCTYPE html>', '<html>', '<head>', '<meta charset="utf-8">',
+             f'<title>{html.escape(title)}</title>', '</head>', '<body>']
+    for style, text in blocks:
+        text = html.escape(text).replace('\n', '<br>\n')
+        if style == 'title':
+            parts.append(f'<h1>{text}</h1>')
+        elif style == 'heading':
+            parts.append(f'<h2><u>{text}</u></h2>')
+        else:
+            parts.append(f'<p style="margin-left: {PREVIEW_INDENT.get(style, 0)}cm">{text}</p>')
+    parts += ['</body>', '</html>', '']
+    return '\n'.join(parts)
+
+
 # TODO rework to overrides the Document.save method.
 # TODO add all feature?
 # returns True if file doesn't exist
@@ -669,7 +1316,7 @@ def usage():
 
     help = """
 Usage:
-    C:\...> python3 request_builder2.py [date] [Report]
+    C:\...> python3 request_builder2.py [date] [Report] [--preview[=FILE.html]]
 
     [date]
         is in YYYY-MM format, so December 2020 is 2020-12
@@ -679,27 +1326,49 @@ Usage:
         PC  -  Generate Planning Commision Agenda
         PCNEWS - PC Public Hearings newspaper publication
         PCMAIL - Planning Commission Mailings
-        ZNGANX - Set Public Hearings for Rezoning/Zoning/Annexation (Does NOT yet work.)
+        ZNGANX - Set Public Hearings for Rezoning/Zoning/Annexation
+                 (legal descriptions are read from LEGALDES .docx/.txt files in each case's folder)
+
+    --preview
+        shows the DRT, PC, PCNEWS or PCMAIL report as text instead of generating it
+    --preview=FILE.html
+        writes the preview to an HTML file
 """
     print(help)
 
 ################################################################################################
 if __name__ == '__main__':
 # This works pretty well for testing.
+    # --preview can be anywhere in the arguments
+    preview = None
+    args = []
+    for arg in sys.argv[1:]:
+        if arg == '--preview':
+            preview = 'text'
+        elif arg.startswith('--preview='):
+            preview = arg[len('--preview='):]
+            if preview == '' or not preview.lower().endswith('.html'):
+                print("The preview file must be an .html file, like --preview=preview.html")
+                usage()
+                sys.exit(10)
+            preview = Path(preview)
+        else:
+            args.append(arg)
+
     if len(sys.argv) == 1:   # No Arguments
         usage()
         sys.exit(10)
-    if len(sys.argv) > 3:
+    if len(args) > 2:
         print("Too many arguments.")
         usage()
         sys.exit(10)
-    elif len(sys.argv) < 3:
+    elif len(args) < 2:
         print("Too few arguments.")
         usage()
         sys.exit(10)
 
     # parses meeting's year and month
-    meeting_ym = dt.datetime.strptime(sys.argv[1], "%Y-%m")
+    meeting_ym = dt.datetime.strptime(args[0], "%Y-%m")
 
     # Detect possible typo in year argument.
     if meeting_ym.year != dt.date.today().year:
@@ -710,7 +1379,7 @@ if __name__ == '__main__':
 
     meeting_dates = MeetingDates(year=meeting_ym.year, month=meeting_ym.month)
     
-    report = sys.argv[2]
+    report = args[1]
 
     # this report is just date calculations that do not rely upon the existance of folders.
     if report == 'DATES':
@@ -735,7 +1404,41 @@ if __name__ == '__main__':
         if yn.lower() != 'y':
             print('Exiting.')
             sys.exit(1)
-    
+
+    # Spell check the requests
+    spell_checker = load_spell_checker(drt_folder.parent, drt_folder)
+    if spell_checker is None:
+        print('No list of words was found for the spell checker (words.txt), skipping the spell check.')
+    else:
+        misspelled_count = 0
+        for n, req in enumerate(requests.requests, start=1):
+            for word, suggestions in spell_checker.check(req.text):
+                print(f'{n}. "{word}"  suggestions: {", ".join(suggestions) or "(none)"}')
+                misspelled_count += 1
+        spell_checker.close()
+        # a preview is for proofreading, so it is shown without asking
+        if misspelled_count > 0 and preview is None:
+            yn = input("The above words may be misspelled.  Do you wish to continue? [y/N] ")
+            if yn.lower() != 'y':
+                print('Exiting.')
+                sys.exit(1)
+
+    if preview is not None:
+        previews = {'DRT': preview_drt_agenda,
+                    'PC': preview_pc_agenda,
+                    'PCNEWS': preview_pc_notice,
+                    'PCMAIL': preview_city_mailed_notices}
+        if report not in previews:
+            print(f"The report '{report}' does not have a preview.")
+            sys.exit(10)
+        blocks = previews[report](requests, meeting_dates)
+        if preview == 'text':
+            print(preview_as_text(blocks))
+        else:
+            preview.write_text(preview_as_html(blocks, f'{report} preview {meeting_dates.pc.isoformat()}'), encoding='utf-8')
+            print(f"Wrote file: {preview}")
+        sys.exit(0)
+
     # Create the PC main folder for the Planning Commission
     pc_main_folder = Path(f'../PC')
     if folder_exists_or_create(pc_main_folder) is False:
@@ -761,7 +1464,7 @@ if __name__ == '__main__':
     elif report == 'PCNEWS':
         gen_templates.generate_public_hear_form_for_newspaper_legal(requests)
     elif report == 'ZNGANX':
-        # assumetions that the legal description in a file named LEGALDES .docx or .txt
-        raise NotImplementedError("ZNGANX is not implemented")
+        # the legal description is in a file named LEGALDES .docx or .txt
+        gen_templates.generate_zoning_annexation_notice(requests)
     else:
         print(f"The report '{report}' is not a type of report that this software can generate.")